@@ -125,23 +125,23 @@ try:
 
         @write_parquet.register(pd.DataFrame)
         def write_parquet_pd1(data: pd.DataFrame, filepath: str, name: str) -> None:
-            """Writes a dataframe to a parquet file."""
-            data.to_parquet(filepath)
+            """Writes a dataframe to an uncompressed parquet file."""
+            data.to_parquet(filepath, engine="pyarrow", compression=None)
 
         @write_parquet.register(pd.Series)
         def write_parquet_pd2(data: pd.Series, filepath: str, name: str) -> None:
-            """Writes a data frame to a parquet file."""
-            data.to_frame(name=name).to_parquet(filepath)
+            """Writes a series to an uncompressed parquet file."""
+            data.to_frame(name=name).to_parquet(filepath, engine="pyarrow", compression=None)
 
         @read_parquet.register(pd.DataFrame)
         def read_parquet_pd1(data: pd.DataFrame, filepath: str) -> pd.DataFrame:
             """Reads a dataframe from a parquet file."""
-            return pd.read_parquet(filepath)
+            return pd.read_parquet(filepath, engine="pyarrow")
 
         @read_parquet.register(pd.Series)
         def read_parquet_pd2(data: pd.Series, filepath: str) -> pd.Series:
             """Reads a series from a parquet file."""
-            _df = pd.read_parquet(filepath)
+            _df = pd.read_parquet(filepath, engine="pyarrow")
             return _df[_df.columns[0]]
 
     except ImportError:
@@ -173,7 +173,7 @@ def read_json_dict(data: dict, filepath: str) -> dict:
 def write_pickle_object(data: object, filepath: str, name: str) -> None:
     if isinstance(data, object):
         with open(filepath, "wb") as file:
-            pickle.dump(data, file)
+            pickle.dump(data, file, protocol=pickle.HIGHEST_PROTOCOL)
     else:
         raise ValueError(f"Expected an object, got {type(data)}")
 
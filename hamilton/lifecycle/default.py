@@ -9,7 +9,7 @@ import random
 import shelve
 import time
 from functools import partial
-from typing import Any, Callable, Dict, List, Optional, Type, Union
+from typing import Any, Callable, Dict, List, Optional, Tuple, Type, Union
 
 from hamilton import graph_types, htypes
 from hamilton.graph_types import HamiltonGraph
@@ -331,8 +331,8 @@ class CacheAdapter(NodeExecutionHook, NodeExecutionMethod, GraphExecutionHook):
     e.g., the last value in the list `cache["_node_history"][node_name]` is the most recent cached node.
 
     Notes:
-        - It uses the stdlib `shelve` module and the pickle format, which makes results dependent
-        on the Python version. Use materialization for persistent results
+        - It uses the stdlib `shelve` module and the pickle format (highest protocol available), which
+        makes results dependent on the Python version. Use materialization for persistent results
         - There are no utility to manage cache size so you'll have to delete it periodically. Look
         at the diskcache plugin for Hamilton `hamilton.plugins.h_diskcache` for better cache management.
     """
@@ -350,21 +350,29 @@ class CacheAdapter(NodeExecutionHook, NodeExecutionMethod, GraphExecutionHook):
         """
         self.cache_vars = cache_vars if cache_vars else []
         self.cache_path = cache_path
-        self.cache = shelve.open(self.cache_path)
+        self.cache = shelve.open(self.cache_path, protocol=pickle.HIGHEST_PROTOCOL)
         self.nodes_history: Dict[str, List[str]] = self.cache.get(
             key=CacheAdapter.nodes_history_key, default=dict()
         )
         self.used_nodes_hash: Dict[str, str] = dict()
+        self.callable_hashes: Dict[Callable, str] = dict()
+        self.pending_cache_keys: Dict[Tuple[str, Optional[str]], str] = dict()
         self.cache.close()
 
     def run_before_graph_execution(self, *, graph: HamiltonGraph, **kwargs):
         """Set `cache_vars` to all nodes if received None during `__init__`"""
-        self.cache = shelve.open(self.cache_path)
+        self.cache = shelve.open(self.cache_path, protocol=pickle.HIGHEST_PROTOCOL)
         if len(self.cache_vars) == 0:
             self.cache_vars = [n.name for n in graph.nodes]
 
     def run_to_execute_node(
-        self, *, node_name: str, node_callable: Any, node_kwargs: Dict[str, Any], **kwargs
+        self,
+        *,
+        node_name: str,
+        node_callable: Any,
+        node_kwargs: Dict[str, Any],
+        task_id: Optional[str] = None,
+        **kwargs,
     ):
         """Create cache key based on node callable hash (equiv. to HamiltonNode.version) and
         the node inputs (`node_kwargs`).If key in cache (cache hit), load result; else (cache miss),
@@ -373,38 +381,52 @@ class CacheAdapter(NodeExecutionHook, NodeExecutionMethod, GraphExecutionHook):
         Note:
             - the callable hash is stored  in `used_nodes_hash` because it's required to create the
             key in `run_after_node_execution` and the callable won't be accessible to recompute it
+            - on cache miss, the cache key is stored in `pending_cache_keys` so that
+            `run_after_node_execution` doesn't need to hash the node inputs a second time
         """
         if node_name not in self.cache_vars:
             return node_callable(**node_kwargs)
 
-        source_of_node_callable = node_callable
-        while isinstance(source_of_node_callable, partial):  # handle partials
-            source_of_node_callable = source_of_node_callable.func
-        node_hash = graph_types.hash_source_code(source_of_node_callable, strip=True)
+        node_hash = self._hash_node_callable(node_callable)
         cache_key = CacheAdapter.create_key(node_hash, node_kwargs)
 
         from_cache = self.cache.get(cache_key, None)
         if from_cache is not None:
+            # the hash may remain from a previous miss; clear it so the result isn't stored again
+            self.used_nodes_hash.pop(node_name, None)
             return from_cache
 
         self.used_nodes_hash[node_name] = node_hash
+        self.pending_cache_keys[(node_name, task_id)] = cache_key
         self.nodes_history[node_name] = self.nodes_history.get(node_name, []) + [node_hash]
         return node_callable(**node_kwargs)
 
     def run_after_node_execution(
-        self, *, node_name: str, node_kwargs: Dict[str, Any], result: Any, **kwargs
+        self,
+        *,
+        node_name: str,
+        node_kwargs: Dict[str, Any],
+        result: Any,
+        success: bool = True,
+        task_id: Optional[str] = None,
+        **kwargs,
     ):
         """If `run_to_execute_node` was a cache miss (hash stored in `used_nodes_hash`),
-        store the computed result in cache
+        store the computed result in cache. Results of failed executions aren't stored.
         """
         if node_name not in self.cache_vars:
             return
 
-        node_hash = self.used_nodes_hash.get(node_name)
-        if node_hash is None:
+        cache_key = self.pending_cache_keys.pop((node_name, task_id), None)
+        if not success:
             return
 
-        cache_key = CacheAdapter.create_key(node_hash, node_kwargs)
+        if cache_key is None:
+            node_hash = self.used_nodes_hash.get(node_name)
+            if node_hash is None:
+                return
+            cache_key = CacheAdapter.create_key(node_hash, node_kwargs)
+
         self.cache[cache_key] = result
 
     def run_after_graph_execution(self, *args, **kwargs):
@@ -419,18 +441,49 @@ class CacheAdapter(NodeExecutionHook, NodeExecutionMethod, GraphExecutionHook):
         """Placeholder required to subclass `NodeExecutionMethod`"""
         pass
 
+    def _hash_node_callable(self, node_callable: Callable) -> str:
+        """Get the source code hash of the node callable, unwrapping partials.
+
+        Hashes are memoized per callable in `callable_hashes` because `hash_source_code()`
+        retrieves and parses the source each time, and the same callables are executed on
+        every `.execute()` call of the Driver.
+        """
+        source_of_node_callable = node_callable
+        while isinstance(source_of_node_callable, partial):  # handle partials
+            source_of_node_callable = source_of_node_callable.func
+
+        node_hash = self.callable_hashes.get(source_of_node_callable)
+        if node_hash is None:
+            node_hash = graph_types.hash_source_code(source_of_node_callable, strip=True)
+            self.callable_hashes[source_of_node_callable] = node_hash
+        return node_hash
+
     @staticmethod
     def create_key(node_hash: str, node_inputs: Dict[str, Any]) -> str:
-        """Pickle objects into bytes then get their hash value"""
+        """Pickle objects into bytes then get their hash value.
+
+        The pickled bytes are streamed into the digest instead of being materialized with
+        `pickle.dumps()`, which avoids a full copy of large inputs (e.g., dataframes). Clearing
+        the memo between inputs produces the same bytes, hence the same key, as `pickle.dumps()`.
+        """
         digest = hashlib.sha256()
         digest.update(node_hash.encode())
 
+        pickler = pickle.Pickler(_DigestWriter(digest))
         for ins in node_inputs.values():
-            digest.update(pickle.dumps(ins))
+            pickler.dump(ins)
+            pickler.clear_memo()
 
         return digest.hexdigest()
 
 
+class _DigestWriter:
+    """Minimal file-like object that feeds written bytes to a hash object"""
+
+    def __init__(self, digest: Any):
+        self.write = digest.update
+
+
 def wait_random(mean: float, stddev: float):
     sleep_time = random.gauss(mu=mean, sigma=stddev)
     if sleep_time < 0:
@@ -1,5 +1,5 @@
 import logging
-from typing import Any, Dict, List, Union
+from typing import Any, Callable, Dict, List, Union
 
 import diskcache
 
@@ -86,6 +86,7 @@ class DiskCacheAdapter(
             key=DiskCacheAdapter.nodes_history_key, default=dict()
         )  # type: ignore
         self.used_nodes_hash: Dict[str, str] = dict()
+        self.callable_hashes: Dict[Callable, str] = dict()
 
     def run_before_graph_execution(self, *, graph: graph_types.HamiltonGraph, **kwargs):
         """Set cache_vars to all nodes if not specified"""
@@ -99,7 +100,7 @@ class DiskCacheAdapter(
         if node_name not in self.cache_vars:
             return node_callable(**node_kwargs)
 
-        node_hash = graph_types.hash_source_code(node_callable, strip=True)
+        node_hash = self._hash_node_callable(node_callable)
         self.used_nodes_hash[node_name] = node_hash
         cache_key = (node_hash, *node_kwargs.values())
 
@@ -137,3 +138,15 @@ class DiskCacheAdapter(
 
     def run_before_node_execution(self, *args, **kwargs):
         pass
+
+    def _hash_node_callable(self, node_callable: Callable) -> str:
+        """Memoize the source code hash since the same callables run on every execution.
+
+        Unlike `CacheAdapter`, partials aren't unwrapped: the callable is hashed as-is so keys
+        and tags keep matching what `evict_all_except()` computes from `node.callable`.
+        """
+        node_hash = self.callable_hashes.get(node_callable)
+        if node_hash is None:
+            node_hash = graph_types.hash_source_code(node_callable, strip=True)
+            self.callable_hashes[node_callable] = node_hash
+        return node_hash
@@ -1,5 +1,8 @@
+import dbm
 import functools
+import hashlib
 import pathlib
+import pickle
 import shelve
 
 import pytest
@@ -167,6 +170,44 @@ def test_commit_nodes_history(hook: CacheAdapter):
         assert cache.get(CacheAdapter.nodes_history_key) == hook.nodes_history
 
 
+def test_cache_uses_highest_pickle_protocol(hook: CacheAdapter):
+    """Values are pickled with the highest protocol and can be read back"""
+    hook.nodes_history = dict(A=["hash_1", "hash_2"])
+
+    hook.run_before_graph_execution(graph=graph_types.HamiltonGraph([]))  # needed to open cache
+    hook.run_after_graph_execution()
+
+    with dbm.open(hook.cache_path, "r") as db:
+        raw_value = db[CacheAdapter.nodes_history_key.encode()]
+    # pickles start with the PROTO opcode followed by the protocol number
+    assert raw_value[:2] == bytes([pickle.PROTO[0], pickle.HIGHEST_PROTOCOL])
+    with shelve.open(hook.cache_path, protocol=pickle.HIGHEST_PROTOCOL) as cache:
+        assert cache.get(CacheAdapter.nodes_history_key) == hook.nodes_history
+
+
+def test_load_cache_written_with_default_protocol(tmp_path: pathlib.Path, node_a: node.Node):
+    """A cache written with shelve's default pickle protocol is still readable"""
+    cache_path = str((tmp_path / "cache.db").resolve())
+    node_hash = graph_types.hash_source_code(node_a.callable, strip=True)
+    node_kwargs = dict(external_input=7)
+    nodes_history = dict(A=[node_hash])
+    with shelve.open(cache_path) as cache:
+        cache[CacheAdapter.nodes_history_key] = nodes_history
+        cache[CacheAdapter.create_key(node_hash, node_kwargs)] = 2
+
+    hook = CacheAdapter(cache_path=cache_path)
+    hook.cache_vars = [node_a.name]
+    hook.run_before_graph_execution(graph=graph_types.HamiltonGraph([]))  # needed to open cache
+    retrieved = hook.run_to_execute_node(
+        node_name=node_a.name,
+        node_kwargs=node_kwargs,
+        node_callable=node_a.callable,
+    )
+
+    assert hook.nodes_history == nodes_history
+    assert retrieved == 2
+
+
 def test_partial_handling(hook: CacheAdapter, node_a_partial: node.Node):
     """Tests partial functions are handled properly"""
     hook.cache_vars = [node_a_partial.name]
@@ -211,3 +252,131 @@ def test_nested_partial_handling(hook: CacheAdapter, node_a_nested_partial: node
         node_callable=node_a_nested_partial.callable,
     )
     assert result2 == result
+
+
+def test_node_hash_is_memoized(hook: CacheAdapter, node_a: node.Node, monkeypatch):
+    """The source code of a callable is hashed once per adapter"""
+    calls = []
+    hash_source_code = graph_types.hash_source_code
+
+    def counting_hash_source_code(*args, **kwargs):
+        calls.append(args)
+        return hash_source_code(*args, **kwargs)
+
+    monkeypatch.setattr(graph_types, "hash_source_code", counting_hash_source_code)
+    hook.cache_vars = [node_a.name]
+    hook.run_before_graph_execution(graph=graph_types.HamiltonGraph([]))  # needed to open cache
+    for external_input in [7, 8]:
+        hook.run_to_execute_node(
+            node_name=node_a.name,
+            node_kwargs=dict(external_input=external_input),
+            node_callable=node_a.callable,
+        )
+
+    assert len(calls) == 1
+    assert hook.callable_hashes[node_a.callable] == hash_source_code(node_a.callable, strip=True)
+
+
+def test_cache_key_is_reused_after_execution(hook: CacheAdapter, node_a: node.Node, monkeypatch):
+    """On cache miss, the key from `run_to_execute_node` is reused to store the result"""
+    hook.cache_vars = [node_a.name]
+    hook.run_before_graph_execution(graph=graph_types.HamiltonGraph([]))  # needed to open cache
+    node_kwargs = dict(external_input=7)
+    result = hook.run_to_execute_node(
+        node_name=node_a.name,
+        node_kwargs=node_kwargs,
+        node_callable=node_a.callable,
+        task_id=None,
+    )
+    expected_key = hook.pending_cache_keys[(node_a.name, None)]
+
+    def fail_create_key(*args, **kwargs):
+        raise AssertionError("cache key should not be recomputed")
+
+    monkeypatch.setattr(CacheAdapter, "create_key", fail_create_key)
+    hook.run_after_node_execution(
+        node_name=node_a.name,
+        node_kwargs=node_kwargs,
+        result=result,
+        task_id=None,
+    )
+
+    assert hook.pending_cache_keys == {}
+    assert hook.cache.get(expected_key) == result
+
+
+def test_failed_execution_is_not_cached(hook: CacheAdapter):
+    """A failed execution doesn't store a result, so the next successful one is cached"""
+    attempts = []
+
+    def A(external_input: int) -> int:
+        attempts.append(external_input)
+        if len(attempts) == 1:
+            raise ValueError("fails once")
+        return external_input + 1
+
+    node_a = _callable_to_node(A)
+    node_kwargs = dict(external_input=1)
+    hook.cache_vars = [node_a.name]
+    hook.run_before_graph_execution(graph=graph_types.HamiltonGraph([]))  # needed to open cache
+
+    with pytest.raises(ValueError):
+        hook.run_to_execute_node(
+            node_name=node_a.name,
+            node_kwargs=node_kwargs,
+            node_callable=node_a.callable,
+        )
+    hook.run_after_node_execution(
+        node_name=node_a.name,
+        node_kwargs=node_kwargs,
+        result=None,
+        success=False,
+    )
+    node_hash = graph_types.hash_source_code(node_a.callable, strip=True)
+    cache_key = CacheAdapter.create_key(node_hash, node_kwargs)
+    assert cache_key not in hook.cache
+
+    result = hook.run_to_execute_node(
+        node_name=node_a.name,
+        node_kwargs=node_kwargs,
+        node_callable=node_a.callable,
+    )
+    hook.run_after_node_execution(
+        node_name=node_a.name,
+        node_kwargs=node_kwargs,
+        result=result,
+        success=True,
+    )
+
+    assert hook.cache.get(cache_key) == 2
+
+
+def test_cache_hit_clears_used_node_hash(hook: CacheAdapter, node_a: node.Node):
+    """A cache hit doesn't leave a hash in `used_nodes_hash` from a previous miss"""
+    node_hash = graph_types.hash_source_code(node_a.callable, strip=True)
+    node_kwargs = dict(external_input=7)
+
+    hook.run_before_graph_execution(graph=graph_types.HamiltonGraph([]))  # needed to open cache
+    hook.cache_vars = [node_a.name]
+    hook.cache[CacheAdapter.create_key(node_hash, node_kwargs)] = 0
+    hook.used_nodes_hash[node_a.name] = node_hash
+    hook.run_to_execute_node(
+        node_name=node_a.name,
+        node_kwargs=node_kwargs,
+        node_callable=node_a.callable,
+    )
+
+    assert node_a.name not in hook.used_nodes_hash
+
+
+def test_create_key_matches_pickled_bytes():
+    """Streaming inputs into the digest gives the same key as hashing `pickle.dumps()`"""
+    shared = [1, 2, 3]
+    node_inputs = dict(a=shared, b={"c": shared}, d="string", e=7.0)
+
+    digest = hashlib.sha256()
+    digest.update("node_hash".encode())
+    for value in node_inputs.values():
+        digest.update(pickle.dumps(value))
+
+    assert CacheAdapter.create_key("node_hash", node_inputs) == digest.hexdigest()
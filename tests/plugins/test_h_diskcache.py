@@ -92,6 +92,30 @@ def test_get_result(hook: h_diskcache.DiskCacheAdapter, node_a: node.Node):
     assert hook.cache.stats() == (1, 0)
 
 
+def test_node_hash_is_memoized_per_callable(
+    hook: h_diskcache.DiskCacheAdapter, node_a: node.Node, node_a_body: node.Node, monkeypatch
+):
+    """Each node version is hashed once, however many times it runs"""
+    hashed_callables = []
+    hash_source_code = graph_types.hash_source_code
+
+    def recording_hash_source_code(source, strip=False):
+        hashed_callables.append(source)
+        return hash_source_code(source, strip=strip)
+
+    monkeypatch.setattr(graph_types, "hash_source_code", recording_hash_source_code)
+    hook.cache_vars = [node_a.name]
+    for node_version in [node_a, node_a_body, node_a, node_a_body]:
+        hook.run_to_execute_node(
+            node_name=node_version.name,
+            node_kwargs=dict(external_input=7),
+            node_callable=node_version.callable,
+        )
+
+    assert hashed_callables == [node_a.callable, node_a_body.callable]
+    assert hook.used_nodes_hash[node_a.name] == hash_source_code(node_a_body.callable, strip=True)
+
+
 def test_append_nodes_history(
     hook: h_diskcache.DiskCacheAdapter,
     node_a: node.Node,